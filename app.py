@@ -108,6 +108,66 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+def _frame_version(df: pd.DataFrame) -> tuple:
+    """
+    Cheap cache key for a loaded DataFrame.
+    
+    New form responses change the row count and latest timestamp, so
+    there is no need to hash every cell.
+    """
+    ts_col = 'Timestamp' if 'Timestamp' in df.columns else 'Date'
+    latest = df[ts_col].max() if ts_col in df.columns else None
+    return (len(df), tuple(df.columns), latest)
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=2,  # Each new sheet version would otherwise add a frame
+    hash_funcs={pd.DataFrame: _frame_version}
+)
+def _enriched(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add readiness, trend and z-score columns to the loaded data.
+    
+    Cached so widget reruns skip the calculations while the source data
+    is unchanged. Rows come back ordered by date, then athlete, which
+    the date filter relies on.
+    
+    Args:
+        df: Normalized DataFrame from the data loader
+        
+    Returns:
+        DataFrame with calculated columns
+    """
+    df = add_readiness_column(df)
+    df = add_all_trends(df)
+    df = add_all_zscores(df)
+    
+    # Trends leave rows in athlete/date order; a stable sort on Date
+    # keeps athletes ordered within each day
+    if 'Date' in df.columns:
+        df = df.sort_values('Date', kind='mergesort')
+    
+    return df
+
+
+def _athlete_df(df: pd.DataFrame, athlete: str) -> pd.DataFrame:
+    """
+    Slice the rows for a single athlete, sorted by date.
+    
+    Computed once per rerun and shared by the athlete-level components,
+    instead of each one re-masking the full DataFrame.
+    
+    Args:
+        df: DataFrame with all athletes' data
+        athlete: Athlete name
+        
+    Returns:
+        DataFrame with only the athlete's rows
+    """
+    return df[df['Athlete'] == athlete].sort_values('Date').reset_index(drop=True)
+
+
 def main():
     """Main application logic."""
     
@@ -157,9 +217,7 @@ def main():
                 return
             
             # Process data - add calculated columns
-            df = add_readiness_column(df)
-            df = add_all_trends(df)
-            df = add_all_zscores(df)
+            df = _enriched(df)
             
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
@@ -185,8 +243,11 @@ def main():
         # Date filter
         st.subheader("📅 Date Range")
         
-        min_date = df['Date'].min().date() if 'Date' in df.columns else datetime.now().date()
-        max_date = df['Date'].max().date() if 'Date' in df.columns else datetime.now().date()
+        if 'Date' in df.columns:
+            d_min, d_max = df['Date'].agg(['min', 'max'])
+            min_date, max_date = d_min.date(), d_max.date()
+        else:
+            min_date = max_date = datetime.now().date()
         
         date_range = st.date_input(
             "Select dates",
@@ -196,9 +257,16 @@ def main():
         )
         
         # Apply date filter
-        if len(date_range) == 2:
-            mask = (df['Date'].dt.date >= date_range[0]) & (df['Date'].dt.date <= date_range[1])
-            df = df[mask]
+        if len(date_range) == 2 and 'Date' in df.columns:
+            lo = np.datetime64(date_range[0])
+            hi = np.datetime64(date_range[1]) + np.timedelta64(1, 'D')
+            
+            # Binary-search the date bounds instead of masking every row.
+            # _enriched sorts missing dates (NaT) last, so search only the
+            # dated prefix; undated rows always fall outside the range.
+            n_dated = df['Date'].count()
+            start, end = np.searchsorted(df['Date'].values[:n_dated], [lo, hi])
+            df = df.iloc[start:end]
         
         st.divider()
         
@@ -215,6 +283,9 @@ def main():
             if st.button("💬 Open AI Coach"):
                 st.session_state['show_chat'] = True
     
+    # Rows for the selected athlete, shared by the athlete-level views
+    athlete_df = _athlete_df(df, selected_athlete)
+    
     # Main content area
     # Team Summary
     render_team_summary_card(df)
@@ -225,11 +296,11 @@ def main():
     
     # Athlete Profile
     st.header(f"Athlete: {selected_athlete}")
-    render_athlete_profile(df, selected_athlete)
+    render_athlete_profile(athlete_df, selected_athlete)
     
     # Metric Cards
     st.subheader("Current Metrics")
-    metrics = create_athlete_metrics_display(df, selected_athlete)
+    metrics = create_athlete_metrics_display(athlete_df, selected_athlete)
     
     if metrics:
         render_metric_row(metrics, columns=5)
@@ -238,7 +309,7 @@ def main():
     
     # AI Insights Panel (if enabled and in individual mode)
     if ai_enabled and 'analysis_mode' in locals() and analysis_mode == "Individual":
-        render_ai_insights_panel(df, selected_athlete)
+        render_ai_insights_panel(athlete_df, selected_athlete)
     
     # AI Comparison (if enabled and in comparison mode)
     if ai_enabled and 'analysis_mode' in locals() and analysis_mode == "Comparison":
@@ -247,14 +318,22 @@ def main():
     # Charts Section
     st.subheader("Trends Analysis")
     
-    # Create tabs for different visualizations
+    # Views for different visualizations. A radio is used instead of
+    # st.tabs because tabs run every block on each rerun; this way only
+    # the selected view builds its figures.
     tab_names = ["📈 Trends", "🎯 Radar", "🔥 Heatmap", "📊 Comparison"]
     if ai_enabled:
         tab_names.append("🤖 AI Analysis")
     
-    tabs = st.tabs(tab_names)
+    active_tab = st.radio(
+        "View",
+        options=tab_names,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_tab"
+    )
     
-    with tabs[0]:
+    if active_tab == "📈 Trends":
         # Trend charts for key metrics
         col1, col2 = st.columns(2)
         
@@ -278,21 +357,21 @@ def main():
                 use_container_width=True
             )
     
-    with tabs[1]:
+    elif active_tab == "🎯 Radar":
         # Radar chart
         st.plotly_chart(
-            create_radar_chart(df, selected_athlete),
+            create_radar_chart(athlete_df, selected_athlete),
             use_container_width=True
         )
     
-    with tabs[2]:
+    elif active_tab == "🔥 Heatmap":
         # Z-score heatmap
         st.plotly_chart(
-            create_heatmap(df, selected_athlete),
+            create_heatmap(athlete_df, selected_athlete),
             use_container_width=True
         )
     
-    with tabs[3]:
+    elif active_tab == "📊 Comparison":
         # Multi-athlete comparison
         st.subheader("Compare Athletes")
         
@@ -315,45 +394,43 @@ def main():
         else:
             st.info("Select at least 2 athletes to compare")
     
-    # AI Analysis tab (if enabled)
-    if ai_enabled and len(tabs) > 4:
-        with tabs[4]:
-            st.subheader("🧠 Deep AI Analysis")
-            
-            analysis_type = st.selectbox(
-                "Choose Analysis Type",
-                ["Performance Prediction", "Recovery Recommendations", 
-                 "Training Load Optimization", "Injury Risk Assessment"]
-            )
-            
-            if st.button("Generate Analysis"):
-                with st.spinner("Running AI analysis..."):
-                    from utils.ai_insights import WellnessAIAnalyst
-                    
-                    analyst = WellnessAIAnalyst()
-                    summary = analyst.prepare_data_summary(df, selected_athlete)
-                    
-                    # Focus areas based on analysis type
-                    focus_map = {
-                        "Performance Prediction": ["readiness trends", "energy levels", "recovery status"],
-                        "Recovery Recommendations": ["sleep quality", "stress management", "fatigue levels"],
-                        "Training Load Optimization": ["readiness score", "fatigue", "soreness"],
-                        "Injury Risk Assessment": ["soreness trends", "fatigue accumulation", "recovery patterns"]
-                    }
-                    
-                    insights = analyst.generate_athlete_insights(
-                        summary,
-                        focus_areas=focus_map.get(analysis_type, [])
-                    )
-                    
-                    st.markdown(insights)
+    elif active_tab == "🤖 AI Analysis":
+        st.subheader("🧠 Deep AI Analysis")
+        
+        analysis_type = st.selectbox(
+            "Choose Analysis Type",
+            ["Performance Prediction", "Recovery Recommendations", 
+             "Training Load Optimization", "Injury Risk Assessment"]
+        )
+        
+        if st.button("Generate Analysis"):
+            with st.spinner("Running AI analysis..."):
+                from utils.ai_insights import WellnessAIAnalyst
+                
+                analyst = WellnessAIAnalyst()
+                summary = analyst.prepare_data_summary(athlete_df, selected_athlete)
+                
+                # Focus areas based on analysis type
+                focus_map = {
+                    "Performance Prediction": ["readiness trends", "energy levels", "recovery status"],
+                    "Recovery Recommendations": ["sleep quality", "stress management", "fatigue levels"],
+                    "Training Load Optimization": ["readiness score", "fatigue", "soreness"],
+                    "Injury Risk Assessment": ["soreness trends", "fatigue accumulation", "recovery patterns"]
+                }
+                
+                insights = analyst.generate_athlete_insights(
+                    summary,
+                    focus_areas=focus_map.get(analysis_type, [])
+                )
+                
+                st.markdown(insights)
     
     # Historical Data Table
     st.subheader("Historical Data")
-    render_historical_table(df, selected_athlete, num_days=14)
+    render_historical_table(athlete_df, selected_athlete, num_days=14)
     
     # Basic Insights (non-AI)
-    render_insights(df, selected_athlete)
+    render_insights(athlete_df, selected_athlete)
     
     # AI Chat Interface (if enabled and requested)
     if ai_enabled and st.session_state.get('show_chat', False):
@@ -11,9 +11,45 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import streamlit as st
+import numpy as np
+from tsdownsample import MinMaxLTTBDownsampler
 from typing import Optional, List
 
 
+# Max points sent to the browser per time-series trace
+MAX_TRACE_POINTS = 2000
+
+
+def _downsample_indices(
+    x: pd.Series,
+    y: pd.Series,
+    n_out: int = MAX_TRACE_POINTS
+) -> np.ndarray:
+    """
+    Select row positions that preserve the shape of a time series.
+    
+    Uses tsdownsample's MinMaxLTTB, which keeps peaks and dips that
+    plain decimation would drop.
+    
+    Args:
+        x: Date values (sorted ascending)
+        y: Metric values
+        n_out: Maximum number of points to keep
+        
+    Returns:
+        Array of integer row positions
+    """
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+    
+    return MinMaxLTTBDownsampler().downsample(
+        x.values.astype('int64'),
+        y.values.astype('float64'),
+        n_out=n_out
+    )
+
+
 def create_trend_line_chart(
     df: pd.DataFrame,
     metric: str,
@@ -49,7 +85,10 @@ def create_trend_line_chart(
     
     # Add athlete line
     if athlete:
-        athlete_df = plot_df[plot_df['Athlete'] == athlete]
+        athlete_df = plot_df[plot_df['Athlete'] == athlete].sort_values('Date')
+        athlete_df = athlete_df.iloc[
+            _downsample_indices(athlete_df['Date'], athlete_df[metric])
+        ]
         
         # Get trend data if available
         trend_col = f"{metric}_Trend"
@@ -67,7 +106,7 @@ def create_trend_line_chart(
                 for _, row in athlete_df.iterrows()
             ]
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=athlete_df['Date'],
             y=athlete_df[metric],
             mode='lines+markers',
@@ -81,8 +120,11 @@ def create_trend_line_chart(
     # Add team average overlay
     if show_team_overlay:
         team_avg = plot_df.groupby('Date')[metric].mean().reset_index()
+        team_avg = team_avg.iloc[
+            _downsample_indices(team_avg['Date'], team_avg[metric])
+        ]
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=team_avg['Date'],
             y=team_avg[metric],
             mode='lines',
@@ -159,7 +201,7 @@ def create_comparison_chart(
                 marker_color=color
             ))
         else:
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=athlete_df['Date'],
                 y=athlete_df[metric],
                 mode='lines+markers',
@@ -187,16 +229,22 @@ def create_heatmap(
     df: pd.DataFrame,
     athlete: str,
     metrics: List[str] = None,
-    height: int = 400
+    height: int = 400,
+    max_days: int = 200
 ) -> go.Figure:
     """
     Create a heatmap of z-scores for an athlete.
     
+    Histories spanning more than ``max_days`` distinct days are averaged
+    into weekly buckets, since daily cells can't be resolved at that
+    width anyway. Each bucket is labelled with its first entry date.
+    
     Args:
         df: DataFrame with z-score columns
         athlete: Athlete name
         metrics: List of metrics (uses z-score columns)
         height: Chart height
+        max_days: Number of distinct days above which data is bucketed weekly
         
     Returns:
         Plotly figure
@@ -225,6 +273,16 @@ def create_heatmap(
     # Sort by date
     athlete_df = athlete_df.sort_values('Date')
     
+    # Collapse long histories to weekly means
+    if athlete_df['Date'].nunique() > max_days:
+        weeks = athlete_df['Date'].dt.to_period('W')
+        aggregations = {'Date': 'min', **{col: 'mean' for col in zscore_cols}}
+        athlete_df = (
+            athlete_df.groupby(weeks)
+            .agg(aggregations)
+            .reset_index(drop=True)
+        )
+    
     # Create matrix
     z_data = athlete_df[zscore_cols].T.values
     
@@ -100,6 +100,10 @@ def render_metric_row(
             )
 
 
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: (d['Date'].max(), len(d))}
+)
 def create_athlete_metrics_display(
     df: pd.DataFrame,
     athlete: str,
@@ -108,6 +112,9 @@ def create_athlete_metrics_display(
     """
     Prepare metrics data for display cards.
     
+    Cached on the athlete and the frame's latest date and row count, so
+    reruns that don't change the data skip the lookup.
+    
     Args:
         df: DataFrame with metrics and trends
         athlete: Athlete name
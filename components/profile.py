@@ -104,7 +104,7 @@ def render_historical_table(
         display_df['Date'] = display_df['Date'].dt.strftime('%Y-%m-%d')
     
     # Round numeric columns
-    numeric_cols = display_df.select_dtypes(include=['float64', 'int64']).columns
+    numeric_cols = display_df.select_dtypes(include='number').columns
     for col in numeric_cols:
         display_df[col] = display_df[col].round(1)
     
@@ -64,31 +64,34 @@ def compute_trend(
     df = df.sort_values(['Athlete', 'Date'])
     
     # Calculate difference from previous value per athlete
-    df['_prev'] = df.groupby('Athlete')[metric_col].shift(1)
-    df['_diff'] = df[metric_col] - df['_prev']
+    prev = df.groupby('Athlete', sort=False, observed=True)[metric_col].shift(1)
+    diff = df[metric_col] - prev
+    df[trend_col] = _classify_diff(diff)
     
-    # Map to trend categories
+    return df
+
+
+def _classify_diff(diff: pd.Series) -> np.ndarray:
+    """Map differences from the previous value to UP/DOWN/FLAT."""
     conditions = [
-        pd.isna(df['_diff']),
-        df['_diff'] > 0,
-        df['_diff'] < 0,
-        df['_diff'] == 0
+        pd.isna(diff),
+        diff > 0,
+        diff < 0,
+        diff == 0
     ]
     
     choices = [np.nan, 'UP', 'DOWN', 'FLAT']
     
-    df[trend_col] = np.select(conditions, choices, default=np.nan)
-    
-    # Clean up temporary columns
-    df = df.drop(['_prev', '_diff'], axis=1)
-    
-    return df
+    return np.select(conditions, choices, default=np.nan)
 
 
 def add_all_trends(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add trend columns for all standard metrics.
     
+    Previous values for every metric come from a single grouped shift,
+    rather than one pass per metric.
+    
     Args:
         df: DataFrame with metric columns
         
@@ -100,10 +103,25 @@ def add_all_trends(df: pd.DataFrame) -> pd.DataFrame:
     # List of metrics to calculate trends for
     metrics = ['Sleep', 'Mood', 'Energy', 'Stress', 'Soreness', 
                'Fatigue', 'Readiness', 'SleepMinutes']
+    metrics = [metric for metric in metrics if metric in df.columns]
+    
+    if not metrics:
+        return df
+    
+    if not all(col in df.columns for col in ['Athlete', 'Date']):
+        for metric in metrics:
+            df[f"{metric}_Trend"] = np.nan
+        return df
+    
+    # Sort by athlete and date
+    df = df.sort_values(['Athlete', 'Date'])
+    
+    # Difference from the previous value per athlete, all metrics at once
+    prev = df.groupby('Athlete', sort=False, observed=True)[metrics].shift(1)
+    diffs = df[metrics] - prev
     
     for metric in metrics:
-        if metric in df.columns:
-            df = compute_trend(df, metric)
+        df[f"{metric}_Trend"] = _classify_diff(diffs[metric])
     
     return df
 
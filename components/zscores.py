@@ -56,23 +56,20 @@ def calculate_zscore_by_date(
             df[zscore_col] = np.nan
             return df
     
-    # Calculate group statistics
-    group_stats = df.groupby(by)[metric_col].agg(['mean', 'std']).reset_index()
+    groupby = df.groupby(by, sort=False)
     
-    # Merge back with original data
-    df = df.merge(group_stats, on=by, how='left', suffixes=('', '_group'))
+    # Broadcast group statistics back onto each row
+    group_mean = groupby[metric_col].transform('mean')
+    group_std = groupby[metric_col].transform('std')
     
     # Calculate z-score
     # Use population std (ddof=0) to match DAX STDEV.P
     df[zscore_col] = np.where(
-        df['std'] > 0,
-        (df[metric_col] - df['mean']) / df['std'],
+        group_std > 0,
+        (df[metric_col] - group_mean) / group_std,
         np.nan
     )
     
-    # Clean up temporary columns
-    df = df.drop(['mean', 'std'], axis=1)
-    
     return df
 
 
@@ -80,6 +77,9 @@ def add_all_zscores(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add z-score columns for all standard metrics.
     
+    Date cohort means and standard deviations for every metric come from
+    a single grouped transform each, rather than one pass per metric.
+    
     Args:
         df: DataFrame with metric columns
         
@@ -91,10 +91,27 @@ def add_all_zscores(df: pd.DataFrame) -> pd.DataFrame:
     # List of metrics to calculate z-scores for
     metrics = ['Sleep', 'Mood', 'Energy', 'Stress', 'Soreness', 
                'Fatigue', 'Readiness', 'SleepMinutes']
+    metrics = [metric for metric in metrics if metric in df.columns]
+    
+    if not metrics:
+        return df
+    
+    if 'Date' not in df.columns:
+        for metric in metrics:
+            df[f"{metric}_ZScore"] = np.nan
+        return df
+    
+    groupby = df.groupby('Date', sort=False)
+    
+    # Broadcast cohort statistics for all metrics at once
+    group_mean = groupby[metrics].transform('mean')
+    group_std = groupby[metrics].transform('std')
+    
+    zscores = (df[metrics] - group_mean) / group_std
+    zscores = zscores.where(group_std > 0)
     
     for metric in metrics:
-        if metric in df.columns:
-            df = calculate_zscore_by_date(df, metric)
+        df[f"{metric}_ZScore"] = zscores[metric]
     
     return df
 
@@ -130,10 +130,10 @@ class WellnessAIAnalyst:
         for metric in ['Sleep', 'Mood', 'Energy', 'Stress', 'Soreness', 'Fatigue', 'Readiness']:
             if metric in data.columns:
                 summary['averages'][metric] = {
-                    'mean': round(data[metric].mean(), 2) if not data[metric].isna().all() else None,
-                    'std': round(data[metric].std(), 2) if not data[metric].isna().all() else None,
-                    'min': round(data[metric].min(), 2) if not data[metric].isna().all() else None,
-                    'max': round(data[metric].max(), 2) if not data[metric].isna().all() else None
+                    'mean': round(float(data[metric].mean()), 2) if not data[metric].isna().all() else None,
+                    'std': round(float(data[metric].std()), 2) if not data[metric].isna().all() else None,
+                    'min': round(float(data[metric].min()), 2) if not data[metric].isna().all() else None,
+                    'max': round(float(data[metric].max()), 2) if not data[metric].isna().all() else None
                 }
         
         # Sleep patterns
@@ -280,7 +280,7 @@ Keep the response concise, practical, and encouraging. Use metrics to support ob
         # Calculate team averages
         for metric in ['Sleep', 'Mood', 'Energy', 'Stress', 'Readiness']:
             if metric in recent_df.columns:
-                team_summary['team_averages'][metric] = round(recent_df[metric].mean(), 2)
+                team_summary['team_averages'][metric] = round(float(recent_df[metric].mean()), 2)
         
         # Get individual athlete summaries
         if 'Athlete' in df.columns:
@@ -295,11 +295,11 @@ Keep the response concise, practical, and encouraging. Use metrics to support ob
         # Identify outliers (athletes significantly below team average)
         if 'Readiness' in recent_df.columns and 'Athlete' in recent_df.columns:
             team_avg_readiness = recent_df['Readiness'].mean()
-            athlete_readiness = recent_df.groupby('Athlete')['Readiness'].mean()
+            athlete_readiness = recent_df.groupby('Athlete', observed=True)['Readiness'].mean()
             
             for athlete, readiness in athlete_readiness.items():
                 if readiness < team_avg_readiness - 1.5:  # 1.5 points below average
-                    team_summary['outliers'][athlete] = round(readiness, 2)
+                    team_summary['outliers'][athlete] = round(float(readiness), 2)
         
         prompt = f"""Analyze this team's wellness data and provide insights:
 
@@ -13,20 +13,97 @@ from typing import Optional, Dict, Any
 import os
 from datetime import datetime, timedelta
 
-scope = ["https://spreadsheets.google.com/feeds",
-         "https://www.googleapis.com/auth/drive"]
+SCOPE = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
 
-if "GSPREAD_CREDENTIALS" in st.secrets:
-    creds_dict = json.loads(st.secrets["GSPREAD_CREDENTIALS"])
-    creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
-else:
-    creds = Credentials.from_service_account_file("gspread_credentials.json", scopes=scope)
+# Local fallbacks: snapshot of the last good sheet pull, then example data
+SNAPSHOT_FILE = "data/last_good.parquet"
+FALLBACK_CSV = "data/example_export.csv"
+
+
+# Header variants mapped to the canonical column names. Headers that are
+# already canonical (e.g. 'Mood', 'Energy') need no entry.
+_COLUMN_MAP = {
+    'timestamp': 'Timestamp',
+    'Date': 'Timestamp',
+    'Name': 'Athlete',
+    'Sleep Text': 'SleepText',
+    'Sleep Duration': 'SleepText',
+    'How did you sleep?': 'Sleep',
+    'Sleep Quality': 'Sleep',
+    'How is your mood?': 'Mood',
+    'What is your overall energy level?': 'Energy',
+    'Energy Level': 'Energy',
+    'What is your overall stress level?': 'Stress',
+    'Stress Level': 'Stress',
+    'What is your general soreness?': 'Soreness',
+    'What is your overall fatigue?': 'Fatigue'
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_gspread_client(credentials_file: str = "gspread_credentials.json") -> gspread.Client:
+    """
+    Build an authorized gspread client once per process.
+    
+    Prefers the GSPREAD_CREDENTIALS secret and falls back to the
+    service account JSON file on disk.
+    
+    Args:
+        credentials_file: Path to service account JSON
+        
+    Returns:
+        Authorized gspread client
+    """
+    # Check for secrets.toml first: reading st.secrets without one draws
+    # an error banner, which cached callers would replay on every rerun
+    if st.secrets.load_if_toml_exists() and "GSPREAD_CREDENTIALS" in st.secrets:
+        creds_dict = json.loads(st.secrets["GSPREAD_CREDENTIALS"])
+        creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, SCOPE)
+    else:
+        if not os.path.exists(credentials_file):
+            raise FileNotFoundError(f"Credentials file not found: {credentials_file}")
+        
+        creds = ServiceAccountCredentials.from_json_keyfile_name(
+            credentials_file, SCOPE
+        )
+    
+    return gspread.authorize(creds)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_spreadsheet(
+    sheet_title: str,
+    credentials_file: str = "gspread_credentials.json"
+) -> gspread.Spreadsheet:
+    """Open a spreadsheet by title once per process."""
+    return _get_gspread_client(credentials_file).open(sheet_title)
+
+
+@st.cache_data(ttl=300, show_spinner=False)  # Probe for changes every 5 minutes
+def _sheet_version(
+    sheet_title: str,
+    worksheet_name: str,
+    credentials_file: str
+) -> Optional[int]:
+    """
+    Cheap change token for a worksheet.
+    
+    Fetches only the worksheet metadata; Forms append a row per response,
+    so the row count changes whenever new data arrives. Failures return
+    None instead of raising so they are cached too, and reruns don't
+    retry an unreachable sheet until the TTL expires.
+    """
+    try:
+        spreadsheet = _get_spreadsheet(sheet_title, credentials_file)
+        return spreadsheet.worksheet(worksheet_name).row_count
+    except Exception as e:
+        st.warning(f"Error loading from Google Sheets: {str(e)}")
+        return None
 
-client = gspread.authorize(creds)
-sheet = client.open("Morning Wellness Tracker").worksheet("Form Responses 1")
-data = sheet.get_all_records()
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_google_sheet(
     sheet_title: str,
     worksheet_name: str = "Form Responses 1",
@@ -34,59 +111,118 @@ def load_google_sheet(
     use_fallback: bool = True
 ) -> pd.DataFrame:
     """
-    Load data from Google Sheets with fallback to local CSV.
+    Load data from Google Sheets with fallback to local files.
+    
+    The sheet is only downloaded again when its row count changes (or
+    the cache is cleared via refresh_data). Fallback data is never
+    cached, so the sheet is retried on the next probe.
     
     Args:
         sheet_title: Name of the Google Sheet
         worksheet_name: Name of the worksheet tab (default for Forms)
         credentials_file: Path to service account JSON
-        use_fallback: Whether to use CSV fallback on error
+        use_fallback: Whether to use local fallback data on error
         
     Returns:
         DataFrame with normalized column names and processed dates
     """
+    version = _sheet_version(sheet_title, worksheet_name, credentials_file)
+    
+    if version is None:
+        # Probe failed and has already reported the error
+        if use_fallback:
+            return _load_fallback()
+        raise ConnectionError(f"Could not reach Google Sheet: {sheet_title}")
     
     try:
-        # Authenticate with Google Sheets
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
-        if not os.path.exists(credentials_file):
-            raise FileNotFoundError(f"Credentials file not found: {credentials_file}")
-        
-        creds = ServiceAccountCredentials.from_json_keyfile_name(
-            credentials_file, scope
-        )
-        client = gspread.authorize(creds)
-        
-        # Open the sheet and get data
-        sheet = client.open(sheet_title)
-        worksheet = sheet.worksheet(worksheet_name)
-        
-        # Get all values and convert to DataFrame
-        data = worksheet.get_all_records()
-        df = pd.DataFrame(data)
-        
-        if df.empty:
-            raise ValueError("No data found in sheet")
-            
+        return _load_sheet(sheet_title, worksheet_name, credentials_file, version)
     except Exception as e:
         st.warning(f"Error loading from Google Sheets: {str(e)}")
         
         if use_fallback:
-            st.info("Loading from local example data...")
-            df = pd.read_csv("data/example_export.csv")
-        else:
-            raise e
+            return _load_fallback()
+        
+        raise e
+
+
+@st.cache_data(show_spinner=False, max_entries=2)  # App shows its own spinner
+def _load_sheet(
+    sheet_title: str,
+    worksheet_name: str,
+    credentials_file: str,
+    version: int
+) -> pd.DataFrame:
+    """
+    Download and normalize the sheet, keyed on its version token.
+    
+    Errors are raised rather than handled here so fallback data never
+    ends up in the cache. Each successful pull is snapshotted to Parquet.
+    
+    Args:
+        sheet_title: Name of the Google Sheet
+        worksheet_name: Name of the worksheet tab
+        credentials_file: Path to service account JSON
+        version: Token from _sheet_version
+        
+    Returns:
+        DataFrame with normalized column names and processed dates
+    """
+    # Open the sheet (client and spreadsheet are cached per process)
+    sheet = _get_spreadsheet(sheet_title, credentials_file)
+    worksheet = sheet.worksheet(worksheet_name)
+    
+    # Get raw rows (header first) and build the DataFrame in one go;
+    # values arrive as strings and are coerced in normalize_dataframe
+    rows = worksheet.get_all_values()
+    if not rows:
+        raise ValueError("No data found in sheet")
+    
+    df = pd.DataFrame(rows[1:], columns=rows[0])
+    
+    if df.empty:
+        raise ValueError("No data found in sheet")
     
     # Normalize and process the DataFrame
     df = normalize_dataframe(df)
     
+    _save_snapshot(df)
+    
     return df
 
 
+def _load_fallback() -> pd.DataFrame:
+    """
+    Load the last good snapshot if available, else the example CSV.
+    
+    The snapshot is stored already normalized, so only the CSV goes
+    through normalize_dataframe.
+    """
+    if os.path.exists(SNAPSHOT_FILE):
+        try:
+            df = pd.read_parquet(SNAPSHOT_FILE)
+            if 'Date' not in df.columns or 'Athlete' not in df.columns:
+                raise ValueError("Snapshot is missing required columns")
+            
+            st.info("Loading last successful sync...")
+            return df
+        except Exception:
+            # Unreadable snapshot (e.g. no parquet engine); use the CSV
+            pass
+    
+    st.info("Loading from local example data...")
+    return normalize_dataframe(pd.read_csv(FALLBACK_CSV))
+
+
+def _save_snapshot(df: pd.DataFrame):
+    """Write a normalized DataFrame to the Parquet snapshot (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_FILE), exist_ok=True)
+        df.to_parquet(SNAPSHOT_FILE, index=False)
+    except Exception:
+        # A missing snapshot only costs the faster fallback path
+        pass
+
+
 def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize column names and process data types.
@@ -98,56 +234,31 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         Processed DataFrame with standardized columns
     """
     
-    # Rename columns to match expected names (handle variations)
-    column_mapping = {
-        'Timestamp': 'Timestamp',
-        'timestamp': 'Timestamp',
-        'Date': 'Timestamp',
-        'Athlete': 'Athlete',
-        'Name': 'Athlete',
-        'SleepText': 'SleepText',
-        'Sleep Text': 'SleepText',
-        'Sleep Duration': 'SleepText',
-        'How did you sleep?': 'Sleep',
-        'Sleep Quality': 'Sleep',
-        'How is your mood?': 'Mood',
-        'Mood': 'Mood',
-        'What is your overall energy level?': 'Energy',
-        'Energy Level': 'Energy',
-        'Energy': 'Energy',
-        'What is your overall stress level?': 'Stress',
-        'Stress Level': 'Stress',
-        'Stress': 'Stress',
-        'What is your general soreness?': 'Soreness',
-        'Soreness': 'Soreness',
-        'What is your overall fatigue?': 'Fatigue',
-        'Fatigue': 'Fatigue'
-    }
-    
-    # Apply column mapping
-    df = df.rename(columns=column_mapping)
+    # Strip stray whitespace from sheet headers, then map variants
+    df = df.rename(columns=lambda col: str(col).strip()).rename(columns=_COLUMN_MAP)
     
     # Convert Timestamp to datetime and extract Date
     if 'Timestamp' in df.columns:
         df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
-        df['Date'] = df['Timestamp'].dt.date
-        df['Date'] = pd.to_datetime(df['Date'])
+        df['Date'] = df['Timestamp'].dt.normalize()
     
     # Convert numeric columns
     numeric_columns = ['Sleep', 'Mood', 'Energy', 'Stress', 'Soreness', 'Fatigue']
-    for col in numeric_columns:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    present = [col for col in numeric_columns if col in df.columns]
+    if present:
+        # Single bulk coercion; float32 is plenty for 1-10 ratings
+        df[present] = df[present].apply(pd.to_numeric, errors='coerce').astype('float32')
     
-    # Sort by Date and Athlete
-    if 'Date' in df.columns and 'Athlete' in df.columns:
-        df = df.sort_values(['Date', 'Athlete'])
+    # Athlete names repeat on every row; categorical codes make the
+    # per-athlete masks and groupbys compare ints instead of strings
+    if 'Athlete' in df.columns:
+        df['Athlete'] = df['Athlete'].astype('category')
     
     return df
 
 
 def refresh_data():
-    """Clear the cache to force data refresh."""
+    """Clear the data cache to force a refresh (the gspread client stays cached)."""
     st.cache_data.clear()
     st.success("Data refreshed successfully!")
 
@@ -161,6 +272,13 @@ def get_latest_date(df: pd.DataFrame) -> Optional[datetime]:
 
 def get_athletes(df: pd.DataFrame) -> list:
     """Get unique list of athletes."""
-    if 'Athlete' in df.columns:
-        return sorted(df['Athlete'].dropna().unique().tolist())
-    return []
+    if 'Athlete' not in df.columns:
+        return []
+    
+    athletes = df['Athlete']
+    if isinstance(athletes.dtype, pd.CategoricalDtype):
+        # Categories are already unique and sorted; note they also cover
+        # athletes filtered out of this frame
+        return list(athletes.cat.categories)
+    
+    return sorted(athletes.dropna().unique().tolist())